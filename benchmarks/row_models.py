@@ -0,0 +1,69 @@
+"""
+Benchmark for order row handling: dict copies vs. slotted row models.
+Compares allocations and latency per 100k rows for fetch + serialize.
+
+Run from the project root:  python -m benchmarks.row_models
+"""
+
+from dataclasses import fields
+import json
+import time
+import tracemalloc
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from database import OrderRow
+
+ROWS = 100_000
+FIELDS = [f.name for f in fields(OrderRow)]
+
+def fake_rows():
+    """Tuples shaped like a plain psycopg2 cursor's fetchall()."""
+    return [
+        (f"ORD-bench-{i}", f"B{i:06d}", f"Product {i % 500}", i % 10, "DRAFT", "2026-10-19")
+        for i in range(ROWS)
+    ]
+
+def old_path(rows):
+    """RealDictCursor rows -> per-row dict copy -> jsonable_encoder -> json."""
+    dict_rows = [dict(zip(FIELDS, row)) for row in rows]
+    orders = []
+    for row in dict_rows:
+        orders.append({
+            'order_id': row['order_id'],
+            'batch': row['batch'],
+            'product': row['product'],
+            'requested_qty': int(row['requested_qty']),
+            'status': row['status'],
+            'created_at': row['created_at']
+        })
+    content = jsonable_encoder(orders)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def new_path(rows):
+    """Tuple rows -> OrderRow -> orjson."""
+    orders = [OrderRow(*row) for row in rows]
+    return orjson.dumps(orders)
+
+def measure(name, func, rows):
+    """Print wall time and peak traced allocation for one path."""
+    # Timed separately: tracemalloc itself slows allocation-heavy code.
+    start = time.perf_counter()
+    body = func(rows)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<10} {elapsed * 1000:8.1f} ms  {peak / 1024 / 1024:8.1f} MiB peak  {len(body)} bytes")
+    return body
+
+if __name__ == "__main__":
+    rows = fake_rows()
+    print(f"{ROWS} order rows")
+    old_body = measure("dict+json", old_path, rows)
+    new_body = measure("row+orjson", new_path, rows)
+    assert json.loads(old_body) == json.loads(new_body)
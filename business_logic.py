@@ -36,7 +36,7 @@ def check_expiry(user_id):
     
     for product in products:
         # Check if it"s already a date object or a string
-        expiry_date = product['expiry_date']
+        expiry_date = product.expiry_date
         if isinstance(expiry_date, str):
             expiry_date = datetime.strptime(expiry_date, '%Y-%m-%d').date()
 
@@ -52,8 +52,8 @@ def check_expiry(user_id):
             status = "Safe"
 
         result.append({
-            "name": product["name"],
-            "batch": product["batch"],
+            "name": product.name,
+            "batch": product.batch,
             "days_left": days_left,
             "status": status
         })    
@@ -78,18 +78,18 @@ def auto_create_orders(user_id):
     products = db.get_all_products(user_id)
     
     for p in products:
-        if p["quantity"] < 10:
+        if p.quantity < 10:
             # Check if draft order already exists
-            if not db.check_draft_order_exists(p["batch"], user_id):
+            if not db.check_draft_order_exists(p.batch, user_id):
                 # Create new draft order
                 order_count = db.get_order_count(user_id)
                 order_id = f"ORD-{user_id[:8]}-{order_count + 1}"
                 
                 db.insert_order(
                     order_id=order_id,
-                    batch=p["batch"],
-                    product=p["name"],
-                    requested_qty=10 - p["quantity"],
+                    batch=p.batch,
+                    product=p.name,
+                    requested_qty=10 - p.quantity,
                     status="DRAFT",
                     created_at=datetime.now().strftime("%Y-%m-%d"),
                     user_id=user_id
@@ -101,10 +101,10 @@ def create_order(batch, quantity, user_id):
     
     # Check if draft order exists for this batch
     for o in orders:
-        if o["batch"] == batch and o["status"] == "DRAFT":
+        if o.batch == batch and o.status == "DRAFT":
             # Update existing draft
-            db.update_order_quantity(o["order_id"], quantity, user_id)
-            o["requested_qty"] = quantity
+            db.update_order_quantity(o.order_id, quantity, user_id)
+            o.requested_qty = quantity
             return {"message": "Draft order updated", "order": o}
     
     # Create new order
@@ -119,21 +119,21 @@ def create_order(batch, quantity, user_id):
     db.insert_order(
         order_id=order_id,
         batch=batch,
-        product=product["name"],
+        product=product.name,
         requested_qty=quantity,
         status="DRAFT",
         created_at=datetime.now().strftime("%Y-%m-%d"),
         user_id=user_id
     )
     
-    order = {
-        "order_id": order_id,
-        "batch": batch,
-        "product": product["name"],
-        "requested_qty": quantity,
-        "status": "DRAFT",
-        "created_at": datetime.now().strftime("%Y-%m-%d")
-    }
+    order = db.OrderRow(
+        order_id=order_id,
+        batch=batch,
+        product=product.name,
+        requested_qty=quantity,
+        status="DRAFT",
+        created_at=datetime.now().strftime("%Y-%m-%d")
+    )
     
     return {"message": "Draft order created", "order": order}
 
@@ -155,7 +155,7 @@ def receive_stock(batch, received_quantity, user_id):
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    new_quantity = product['quantity'] + received_quantity
+    new_quantity = product.quantity + received_quantity
     db.update_product_quantity(batch, new_quantity, user_id)
     
     # Auto-create orders if needed
@@ -4,7 +4,10 @@ Handles all SQLite database operations.
 """
 
 import psycopg2
+from psycopg2.extensions import cursor as TupleCursor
 from psycopg2.extras import RealDictCursor
+from dataclasses import dataclass, fields
+from datetime import date
 from fastapi import HTTPException
 import os
 from dotenv import load_dotenv
@@ -13,6 +16,40 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# ========== ROW MODELS ==========
+
+@dataclass(slots=True)
+class ProductRow:
+    """A product row, built positionally from a PRODUCT_COLUMNS select."""
+    name: str
+    price: float
+    quantity: int
+    batch: str
+    expiry_date: str | date
+
+    def __post_init__(self):
+        # Older tables may hold NUMERIC columns, which come back as Decimal
+        # and which orjson cannot serialize.
+        self.price = float(self.price)
+        self.quantity = int(self.quantity)
+
+@dataclass(slots=True)
+class OrderRow:
+    """An order row, built positionally from an ORDER_COLUMNS select."""
+    order_id: str
+    batch: str
+    product: str
+    requested_qty: int
+    status: str
+    created_at: str
+
+    def __post_init__(self):
+        self.requested_qty = int(self.requested_qty)
+
+# SELECT lists follow the field order, since rows are built positionally
+PRODUCT_COLUMNS = ', '.join(f.name for f in fields(ProductRow))
+ORDER_COLUMNS = ', '.join(f.name for f in fields(OrderRow))
+
 def get_db_connection():
     """Get database connection."""
     return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
@@ -54,20 +91,20 @@ def init_db():
 def get_all_products(user_id):
     """Load all products from database for a specific user."""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT name, price, quantity, batch, expiry_date FROM products WHERE user_id = %s', (user_id,))
-    products = cursor.fetchall()
+    cursor = conn.cursor(cursor_factory=TupleCursor)
+    cursor.execute(f'SELECT {PRODUCT_COLUMNS} FROM products WHERE user_id = %s', (user_id,))
+    products = [ProductRow(*row) for row in cursor.fetchall()]
     conn.close()
     return products
 
 def get_product_by_batch(batch, user_id):
     """Get a single product by batch number for a specific user."""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM products WHERE batch = %s AND user_id = %s', (batch, user_id,))
-    product = cursor.fetchone()
+    cursor = conn.cursor(cursor_factory=TupleCursor)
+    cursor.execute(f'SELECT {PRODUCT_COLUMNS} FROM products WHERE batch = %s AND user_id = %s', (batch, user_id,))
+    row = cursor.fetchone()
     conn.close()
-    return product
+    return ProductRow(*row) if row else None
 
 
 
@@ -118,62 +155,29 @@ def delete_product(batch, user_id):
 def get_all_orders(user_id):
     """Load all orders from database for a specific user."""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT order_id, batch, product, requested_qty, status, created_at FROM orders WHERE user_id = %s', (user_id,))
-    rows = cursor.fetchall()
+    cursor = conn.cursor(cursor_factory=TupleCursor)
+    cursor.execute(f'SELECT {ORDER_COLUMNS} FROM orders WHERE user_id = %s', (user_id,))
+    orders = [OrderRow(*row) for row in cursor.fetchall()]
     conn.close()
-    
-    orders = []
-    for row in rows:
-        orders.append({
-            'order_id': row['order_id'],
-            'batch': row['batch'],
-            'product': row['product'],
-            'requested_qty': int(row['requested_qty']),
-            'status': row['status'],
-            'created_at': row['created_at']
-        })
     return orders
 
 def get_draft_orders(user_id):
     """Get all draft orders for a specific user."""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT order_id, batch, product, requested_qty, status, created_at FROM orders WHERE status = %s AND user_id = %s', ("DRAFT",user_id))
-    rows = cursor.fetchall()
+    cursor = conn.cursor(cursor_factory=TupleCursor)
+    cursor.execute(f'SELECT {ORDER_COLUMNS} FROM orders WHERE status = %s AND user_id = %s', ("DRAFT",user_id))
+    orders = [OrderRow(*row) for row in cursor.fetchall()]
     conn.close()
-    
-    orders = []
-    for row in rows:
-        orders.append({
-            'order_id': row['order_id'],
-            'batch': row['batch'],
-            'product': row['product'],
-            'requested_qty': int(row['requested_qty']),
-            'status': row['status'],
-            'created_at': row['created_at']
-        })
     return orders
 
 def get_order_by_id(order_id, user_id):
     """Get an order by ID for a specific user."""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM orders WHERE order_id = %s And user_id = %s', (order_id,user_id))
+    cursor = conn.cursor(cursor_factory=TupleCursor)
+    cursor.execute(f'SELECT {ORDER_COLUMNS} FROM orders WHERE order_id = %s AND user_id = %s', (order_id,user_id))
     row = cursor.fetchone()
     conn.close()
-    
-    if not row:
-        return None
-    
-    return {
-        'order_id': row['order_id'],
-        'batch': row['batch'],
-        'product': row['product'],
-        'requested_qty': int(row['requested_qty']),
-        'status': row['status'],
-        'created_at': row['created_at']
-    }
+    return OrderRow(*row) if row else None
 
 def check_draft_order_exists(batch, user_id):
     """Check if a draft order exists for a batch for a specific user."""
@@ -4,7 +4,7 @@ Main FastAPI application for Inventory Management System.
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 
@@ -105,6 +105,8 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         raise HTTPException(status_code=401, detail=str(result))
     return result
 # ========== PRODUCT ENDPOINTS ==========
+# Row models are dataclasses, which orjson serializes natively. Endpoints that
+# return rows wrap them in ORJSONResponse to skip the jsonable_encoder pass.
 
 @app.post("/products")
 def create_product(product: Product, user_id: str = Depends(get_current_user_id)):
@@ -121,7 +123,7 @@ def create_product(product: Product, user_id: str = Depends(get_current_user_id)
 @app.get("/products")
 def get_products(user_id: str = Depends(get_current_user_id)):
     """Get all products."""
-    return bl.view_products(user_id)
+    return ORJSONResponse(bl.view_products(user_id))
 
 @app.get("/products/expiry")
 def get_expiry_status(user_id: str = Depends(get_current_user_id)):
@@ -138,27 +140,27 @@ def delete_product(batch: str, user_id: str = Depends(get_current_user_id)):
 @app.post("/orders")
 def create_order(batch: str, quantity: int, user_id: str = Depends(get_current_user_id)):
     """Create or update an order."""
-    return bl.create_order(batch, quantity, user_id)
+    return ORJSONResponse(bl.create_order(batch, quantity, user_id))
 
 @app.get("/orders")
 def get_orders(user_id: str = Depends(get_current_user_id)):
     """Get all orders."""
-    return bl.view_orders(user_id)
+    return ORJSONResponse(bl.view_orders(user_id))
 
 @app.get("/orders/drafts")
 def get_draft_orders(user_id: str = Depends(get_current_user_id)):
     """Get all draft orders."""
-    return bl.view_draft_orders(user_id)
+    return ORJSONResponse(bl.view_draft_orders(user_id))
 
 @app.put("/orders/{order_id}")
 def update_order(order_id: str, quantity: int, user_id: str = Depends(get_current_user_id)):
     """Update order quantity."""
-    return bl.update_order(order_id, quantity, user_id)
+    return ORJSONResponse(bl.update_order(order_id, quantity, user_id))
 
 @app.post("/orders/{order_id}/confirm")
 def confirm_order(order_id: str, user_id: str = Depends(get_current_user_id)):
     """Confirm a draft order."""
-    return bl.confirm_order(order_id, user_id)
+    return ORJSONResponse(bl.confirm_order(order_id, user_id))
 
 # ========== SUPPLIER ENDPOINTS ==========
 